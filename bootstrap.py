@@ -12,46 +12,68 @@ It is intended to be invoked by Gemini's `extensions install` runtime via the
 
 from __future__ import annotations
 
+import hashlib
 import os
-import shlex
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
 
-def _which(executable: str) -> str:
-    from shutil import which
-
-    path = which(executable)
-    if not path:
-        raise RuntimeError(f"Required executable '{executable}' not found in PATH")
-    return path
+def _deps_fingerprint(repo_root: Path) -> str:
+    """Hash the dependency manifests so unchanged venvs can skip reinstalling."""
+    digest = hashlib.sha256()
+    for name in ("requirements.runtime.txt", "pyproject.toml"):
+        manifest = repo_root / name
+        if manifest.exists():
+            digest.update(name.encode("utf-8"))
+            digest.update(manifest.read_bytes())
+    return digest.hexdigest()
 
 
 def ensure_venv(venv_dir: Path) -> Path:
     venv_python = venv_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
-    if venv_python.exists():
+    repo_root = Path(__file__).resolve().parent
+    stamp = venv_dir / ".deps-hash"
+    fingerprint = _deps_fingerprint(repo_root)
+
+    if (
+        venv_python.exists()
+        and stamp.exists()
+        and stamp.read_text(encoding="utf-8").strip() == fingerprint
+    ):
         return venv_python
 
-    venv_dir.mkdir(parents=True, exist_ok=True)
-    # Create venv
-    subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
+    # uv reuses a global wheel cache and resolves much faster than pip when available.
+    uv = shutil.which("uv")
 
-    # Upgrade pip and install minimal runtime deps
-    pip = [str(venv_python), "-m", "pip"]
-    subprocess.run(pip + ["install", "--upgrade", "pip"], check=True)
+    if not venv_python.exists():
+        venv_dir.mkdir(parents=True, exist_ok=True)
+        if uv:
+            subprocess.run([uv, "venv", "--python", sys.executable, str(venv_dir)], check=True)
+        else:
+            subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True)
+            # Freshly created venvs may ship a pip too old for editable pyproject installs.
+            pip = [str(venv_python), "-m", "pip"]
+            subprocess.run(pip + ["install", "--upgrade", "pip"], check=True)
 
-    # Prefer requirements.runtime.txt if present, otherwise install the package locally.
-    repo_root = Path(__file__).resolve().parent
+    if uv:
+        install = [uv, "pip", "install", "--python", str(venv_python)]
+    else:
+        pip = [str(venv_python), "-m", "pip"]
+        if subprocess.run(pip + ["--version"], capture_output=True).returncode != 0:
+            # Venvs created by ``uv venv`` are not seeded with pip.
+            subprocess.run([str(venv_python), "-m", "ensurepip", "--upgrade"], check=True)
+        install = pip + ["install"]
+
+    # Prefer requirements.runtime.txt if present; either way install the package itself in
+    # editable mode so local sources are used. A single resolver run covers both.
     runtime_reqs = repo_root / "requirements.runtime.txt"
     if runtime_reqs.exists():
-        subprocess.run(pip + ["install", "-r", str(runtime_reqs)], check=True)
-        # Install the package itself in editable mode so local sources are used.
-        subprocess.run(pip + ["install", "-e", str(repo_root)], check=True)
-    else:
-        # Fallback: install the local project (declared deps in pyproject.toml)
-        subprocess.run(pip + ["install", "-e", str(repo_root)], check=True)
+        install += ["-r", str(runtime_reqs)]
+    subprocess.run(install + ["-e", str(repo_root)], check=True)
 
+    stamp.write_text(fingerprint + "\n", encoding="utf-8")
     return venv_python
 
 
@@ -68,15 +90,17 @@ def main(argv: list[str]) -> int:
     # Build the exec command: venv python -m mcp_shell_aliases <args>
     cmd = [str(venv_python), "-u", "-m", "mcp_shell_aliases"] + argv
 
-    # Ensure unbuffered stdio and a clean environment suitable for MCP stdio.
-    env = os.environ.copy()
-    env.setdefault("PYTHONUNBUFFERED", "1")
+    # Ensure unbuffered stdio for MCP. The process is about to be replaced, so update
+    # os.environ in place rather than copying it.
+    os.environ.setdefault("PYTHONUNBUFFERED", "1")
+    env = os.environ
 
     # Exec the server process
     try:
         # Use replace to give the child the same PID when supported.
-        if hasattr(os, "execvpe"):
-            os.execvpe(cmd[0], cmd, env)
+        # venv_python is absolute, so skip the PATH search execvpe would do.
+        if hasattr(os, "execve"):
+            os.execve(cmd[0], cmd, env)
         else:
             # Windows fallback
             proc = subprocess.Popen(cmd, env=env)
@@ -18,38 +18,74 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+import os
 import re
 import shlex
 import shutil
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple, ValuesView
 
 from .safety import SafetyClassifier
 
 logger = logging.getLogger(__name__)
 
+# Matches whole alias lines across a file in one finditer pass. ``[^\S\n]`` is whitespace
+# that stays on the current line, so CRLF endings and indentation are tolerated. The
+# pattern runs on raw bytes: alias syntax is ASCII, so only captured groups are decoded.
 ALIAS_REGEX = re.compile(
-    r"^alias\s+(?P<name>[A-Za-z0-9_\-]+)=(?P<quote>['\"])(?P<expansion>.*)(?P=quote)\s*$"
+    rb"^[^\S\n]*alias[^\S\n]+(?P<name>[A-Za-z0-9_\-]+)=(?P<quote>['\"])(?P<expansion>.*)"
+    rb"(?P=quote)[^\S\n]*$",
+    re.MULTILINE,
 )
+_INVALID_NAME_CHARS = frozenset(" \t\r\n\f\v!$`\\-")
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Alias:
-    """Represents a parsed shell alias."""
+    """Represents a parsed shell alias.
+
+    Instances are immutable so the lazily built catalog payload can never go stale.
+    """
 
     name: str
     expansion: str
     safe: bool
     source_file: Path
+    # Usage hint shown in catalog payloads, formatted once per parse.
+    example: str = field(init=False, repr=False, compare=False)
+    _payload: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        example = f'alias.exec {{"name":"{self.name}","args":"","dryRun": true}}'
+        if not self.safe:
+            example = f"{example}  # unsafe aliases only support dry runs"
+        object.__setattr__(self, "example", example)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Return the catalog entry for this alias, built once and shared; do not mutate."""
+        payload = self._payload
+        if payload is None:
+            payload = {
+                "name": self.name,
+                "expansion": self.expansion,
+                "safe": self.safe,
+                "sourceFile": str(self.source_file),
+                "example": self.example,
+            }
+            object.__setattr__(self, "_payload", payload)
+        return payload
 
 
 class AliasCatalog:
     """Catalog of aliases discovered from configured files."""
 
+    __slots__ = ("_aliases",)
+
     def __init__(self, aliases: Dict[str, Alias]):
-        self._aliases = dict(aliases)
+        # The catalog takes ownership of ``aliases``; callers hand over a fresh dict.
+        self._aliases = aliases
 
     def get(self, name: str) -> Alias | None:
         return self._aliases.get(name)
@@ -57,13 +93,30 @@ class AliasCatalog:
     def all(self) -> List[Alias]:
         return list(self._aliases.values())
 
+    def values(self) -> ValuesView[Alias]:
+        """Return a live view of the aliases for callers that only iterate once."""
+        return self._aliases.values()
+
+
+def build_catalog(
+    alias_files: List[Path],
+    classifier: SafetyClassifier,
+    parse_cache: Optional[Dict[Path, Tuple[int, int, List[Alias]]]] = None,
+) -> AliasCatalog:
+    """Parse configured files and build alias catalog.
 
-def build_catalog(alias_files: List[Path], classifier: SafetyClassifier) -> AliasCatalog:
-    """Parse configured files and build alias catalog."""
+    When ``parse_cache`` is given, files whose mtime and size match a cached entry
+    reuse that parse instead of being read again. The cache must only be shared
+    between builds that use the same classifier.
+    """
     aliases: Dict[str, Alias] = {}
+    # PATH lookups for duplicate heads, shared across this build only so that newly
+    # installed commands are seen on the next reload.
+    availability: Dict[str, bool] = {}
+
+    parsed_files = [_parse_file_cached(path, classifier, parse_cache) for path in alias_files]
 
-    for path in alias_files:
-        parsed = _parse_file(path, classifier)
+    for parsed in parsed_files:
         for alias in parsed:
             existing = aliases.get(alias.name)
             if existing is None:
@@ -74,7 +127,7 @@ def build_catalog(alias_files: List[Path], classifier: SafetyClassifier) -> Alia
             # This helps when dotfiles define OS-conditional aliases like `gls` (GNU ls)
             # that are not present on Linux. Without evaluating shell conditionals, we
             # approximate intent by refusing to override with an unavailable command.
-            if _can_override(existing, alias):
+            if _can_override(existing, alias, availability):
                 logger.debug(
                     "Alias %s overridden by %s (previous source %s)",
                     alias.name,
@@ -86,28 +139,46 @@ def build_catalog(alias_files: List[Path], classifier: SafetyClassifier) -> Alia
     return AliasCatalog(aliases)
 
 
+def _parse_file_cached(
+    path: Path,
+    classifier: SafetyClassifier,
+    parse_cache: Optional[Dict[Path, Tuple[int, int, List[Alias]]]],
+) -> List[Alias]:
+    if parse_cache is None:
+        return _parse_file(path, classifier)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        parse_cache.pop(path, None)
+        return _parse_file(path, classifier)
+
+    cached = parse_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    parsed = _parse_file(path, classifier)
+    parse_cache[path] = (stat.st_mtime_ns, stat.st_size, parsed)
+    return parsed
+
+
 def _parse_file(path: Path, classifier: SafetyClassifier) -> List[Alias]:
-    if not path.exists():
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
         logger.warning("Alias file %s does not exist", path)
         return []
 
     aliases: List[Alias] = []
-    for idx, line in enumerate(path.read_text(encoding="utf-8", errors="ignore").splitlines(), start=1):
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        match = ALIAS_REGEX.match(stripped)
-        if not match:
-            continue
-
-        name = match.group("name")
-        expansion = _unescape(match.group("expansion"), match.group("quote"))
-
-        if _is_invalid_name(name):
-            logger.debug("Skipping alias %s with invalid name in %s:%d", name, path, idx)
+    for match in ALIAS_REGEX.finditer(data):
+        name = match.group("name").decode("ascii")
+        if not _INVALID_NAME_CHARS.isdisjoint(name):
+            line_no = data.count(b"\n", 0, match.start()) + 1
+            logger.debug("Skipping alias %s with invalid name in %s:%d", name, path, line_no)
             continue
 
+        expansion = _unescape(
+            match.group("expansion").decode("utf-8", errors="ignore"),
+            match.group("quote").decode("ascii"),
+        )
         safe = classifier.is_safe(expansion)
         aliases.append(Alias(name=name, expansion=expansion, safe=safe, source_file=path))
 
@@ -122,10 +193,6 @@ def _unescape(expansion: str, quote: str) -> str:
     return expansion
 
 
-def _is_invalid_name(name: str) -> bool:
-    return bool(re.search(r"[\s!$`\\-]", name))
-
-
 _BUILTIN_OK: set[str] = {
     # Common bash builtins that are valid in non-interactive shells
     "echo",
@@ -146,15 +213,22 @@ def _head_command(expansion: str) -> str | None:
     return parts[0] if parts else None
 
 
-def _is_command_available(cmd: str | None) -> bool:
+def _is_command_available(cmd: str | None, cache: Optional[Dict[str, bool]] = None) -> bool:
     if not cmd:
         return False
     if cmd in _BUILTIN_OK:
         return True
-    return shutil.which(cmd) is not None
+    if cache is None:
+        return shutil.which(cmd) is not None
+    available = cache.get(cmd)
+    if available is None:
+        available = cache[cmd] = shutil.which(cmd) is not None
+    return available
 
 
-def _can_override(existing: Alias, candidate: Alias) -> bool:
+def _can_override(
+    existing: Alias, candidate: Alias, availability: Optional[Dict[str, bool]] = None
+) -> bool:
     """Decide whether a duplicate alias should override the existing one.
 
     Heuristic: allow override if the candidate's head command is available.
@@ -164,9 +238,9 @@ def _can_override(existing: Alias, candidate: Alias) -> bool:
     cand_cmd = _head_command(candidate.expansion)
     exist_cmd = _head_command(existing.expansion)
 
-    cand_ok = _is_command_available(cand_cmd)
+    cand_ok = _is_command_available(cand_cmd, availability)
     if cand_ok:
         return True
 
-    exist_ok = _is_command_available(exist_cmd)
+    exist_ok = _is_command_available(exist_cmd, availability)
     return not exist_ok
@@ -21,10 +21,9 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .config import Config
-from .server import run
 
 logger = logging.getLogger(__name__)
 
@@ -101,38 +100,43 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _expand_path(value: str) -> str:
+    return str(Path(value).expanduser())
+
+
+def _expand_paths(values: List[str]) -> List[str]:
+    return [_expand_path(value) for value in values]
+
+
+# argparse destination -> (override key path, converter). Empty strings and lists are
+# treated like omitted flags.
+_CLI_FIELDS: Tuple[Tuple[str, Tuple[str, ...], Callable[[Any], Any]], ...] = (
+    ("alias_files", ("alias_files",), _expand_paths),
+    ("allow_patterns", ("allow_patterns",), list),
+    ("default_cwd", ("default_cwd",), _expand_path),
+    ("hot_reload", ("enable_hot_reload",), bool),
+    ("max_stdout_bytes", ("execution", "max_stdout_bytes"), int),
+    ("max_stderr_bytes", ("execution", "max_stderr_bytes"), int),
+    ("default_timeout_seconds", ("execution", "default_timeout_seconds"), int),
+    ("allow_cwd_roots", ("allow_cwd_roots",), _expand_paths),
+    ("transport", ("transport",), str),
+    ("http_host", ("http_host",), str),
+    ("http_port", ("http_port",), int),
+    ("http_path", ("http_path",), str),
+)
+
+
 def build_cli_overrides(args: argparse.Namespace) -> Dict[str, Any]:
     overrides: Dict[str, Any] = {}
 
-    if args.alias_files:
-        overrides["alias_files"] = [str(Path(p).expanduser()) for p in args.alias_files]
-    if args.allow_patterns:
-        overrides["allow_patterns"] = list(args.allow_patterns)
-    if args.default_cwd:
-        overrides["default_cwd"] = str(Path(args.default_cwd).expanduser())
-    if args.hot_reload is not None:
-        overrides["enable_hot_reload"] = bool(args.hot_reload)
-
-    execution: Dict[str, Any] = {}
-    if args.max_stdout_bytes is not None:
-        execution["max_stdout_bytes"] = args.max_stdout_bytes
-    if args.max_stderr_bytes is not None:
-        execution["max_stderr_bytes"] = args.max_stderr_bytes
-    if args.default_timeout_seconds is not None:
-        execution["default_timeout_seconds"] = args.default_timeout_seconds
-    if execution:
-        overrides["execution"] = execution
-
-    if args.allow_cwd_roots:
-        overrides["allow_cwd_roots"] = [str(Path(p).expanduser()) for p in args.allow_cwd_roots]
-    if args.transport:
-        overrides["transport"] = args.transport
-    if args.http_host:
-        overrides["http_host"] = args.http_host
-    if args.http_port is not None:
-        overrides["http_port"] = args.http_port
-    if args.http_path:
-        overrides["http_path"] = args.http_path
+    for dest, key, convert in _CLI_FIELDS:
+        value = getattr(args, dest)
+        if value is None or (isinstance(value, (str, list)) and not value):
+            continue
+        target = overrides
+        for part in key[:-1]:
+            target = target.setdefault(part, {})
+        target[key[-1]] = convert(value)
 
     return overrides
 
@@ -142,6 +146,13 @@ def configure_logging(verbose: bool) -> None:
     logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
 
+def run(config: Config) -> None:
+    """Start the server. The server module (and FastMCP) is imported on first use."""
+    from .server import run as run_server
+
+    run_server(config)
+
+
 def main(argv: Optional[List[str]] = None) -> None:
     args = parse_args(argv)
     configure_logging(args.verbose)
@@ -18,16 +18,73 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
-import yaml
+from .serialization import dumps_compact, loads
 
 DEFAULT_CONFIG_FILENAMES = ("config.yaml", "config.yml", "config.json")
 ENV_PREFIX = "MCP_SHELL_ALIASES_"
 
+# Parsed config files keyed by path, tagged with the (mtime_ns, size) they were read at.
+# Least recently used entries are evicted past _PARSE_CACHE_MAX.
+_PARSE_CACHE: "OrderedDict[Path, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_PARSE_CACHE_MAX = 32
+# Opt-in: keep a JSON copy of each parsed YAML config next to it so later processes can
+# skip YAML parsing. Off by default because it writes beside the config file.
+CONFIG_CACHE_ENV = f"{ENV_PREFIX}CONFIG_CACHE"
+_SIDECAR_SUFFIX = ".cache.json"
+# Directories known to hold none of DEFAULT_CONFIG_FILENAMES, keyed to the directory mtime
+# observed at the time. Any entry added or removed bumps the mtime and invalidates this.
+_NEGATIVE_CONFIG_DIRS: Dict[Path, int] = {}
+# Directory mtimes this recent are not trusted: a file created within the same
+# filesystem timestamp tick would not change them.
+_MTIME_SETTLE_NS = 2_000_000_000
+# YAML configs larger than this are streamed to the parser instead of decoded up front.
+_YAML_STREAM_THRESHOLD = 64 * 1024
+
+
+# Home-relative defaults, expanded once at import like the dataclass defaults below.
+_HOME = Path("~").expanduser()
+_HOME_STR = str(_HOME)
+_DEFAULT_AUDIT_LOG_PATH = Path("~/.local/state/mcp-shell-aliases/audit.log").expanduser()
+_DEFAULT_AUDIT_LOG_STR = str(_DEFAULT_AUDIT_LOG_PATH)
+
+_MISSING = object()
+# Parsed config values of these types are shared rather than copied.
+_IMMUTABLE_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+# Env values that are colon-delimited lists, and ones passed through unchanged.
+_ENV_LIST_KEYS = frozenset({"alias_files", "allow_patterns", "allow_cwd_roots"})
+_ENV_STRING_KEYS = frozenset(
+    {"transport", "http_host", "http_path", "default_cwd", "audit_log_path"}
+)
+
+# Environment variable -> key path in the raw config mapping.
+_ENV_KEY_MAP: Dict[str, Tuple[str, ...]] = {
+    f"{ENV_PREFIX}ALIAS_FILES": ("alias_files",),
+    f"{ENV_PREFIX}ALLOW_PATTERNS": ("allow_patterns",),
+    f"{ENV_PREFIX}DEFAULT_CWD": ("default_cwd",),
+    f"{ENV_PREFIX}AUDIT_LOG_PATH": ("audit_log_path",),
+    f"{ENV_PREFIX}ENABLE_HOT_RELOAD": ("enable_hot_reload",),
+    f"{ENV_PREFIX}HOT_RELOAD_INTERVAL_SECONDS": ("hot_reload_interval_seconds",),
+    f"{ENV_PREFIX}MAX_STDOUT_BYTES": ("execution", "max_stdout_bytes"),
+    f"{ENV_PREFIX}MAX_STDERR_BYTES": ("execution", "max_stderr_bytes"),
+    f"{ENV_PREFIX}DEFAULT_TIMEOUT_SECONDS": ("execution", "default_timeout_seconds"),
+    f"{ENV_PREFIX}ALLOW_CWD_ROOTS": ("allow_cwd_roots",),
+    f"{ENV_PREFIX}TRANSPORT": ("transport",),
+    f"{ENV_PREFIX}HTTP_HOST": ("http_host",),
+    f"{ENV_PREFIX}HTTP_PORT": ("http_port",),
+    f"{ENV_PREFIX}HTTP_PATH": ("http_path",),
+}
+
 
 class ConfigError(Exception):
     """Raised when configuration cannot be loaded."""
@@ -42,21 +99,59 @@ class ExecutionLimits:
     default_timeout_seconds: int = 20
 
 
+# (source fields, resolved default cwd, resolved allowed roots, root prefixes)
+_CwdPolicy = Tuple[Tuple[Path, Tuple[Path, ...]], Path, Tuple[Path, ...], Tuple[str, ...]]
+
+
 @dataclass(slots=True)
 class Config:
     """Runtime configuration for the server."""
 
     alias_files: list[Path] = field(default_factory=list)
     allow_patterns: list[str] = field(default_factory=list)
-    default_cwd: Path = Path("~").expanduser()
-    audit_log_path: Path = Path("~/.local/state/mcp-shell-aliases/audit.log").expanduser()
+    default_cwd: Path = _HOME
+    audit_log_path: Path = _DEFAULT_AUDIT_LOG_PATH
     enable_hot_reload: bool = True
+    hot_reload_interval_seconds: float = 0.0
     execution: ExecutionLimits = field(default_factory=ExecutionLimits)
-    allow_cwd_roots: list[Path] = field(default_factory=lambda: [Path("~").expanduser()])
+    allow_cwd_roots: list[Path] = field(default_factory=lambda: [_HOME])
     transport: str = "stdio"
     http_host: str = "127.0.0.1"
     http_port: int = 3921
     http_path: str = "/mcp"
+    # Canonical forms of the cwd policy, keyed on the fields they were resolved from so
+    # reassigning ``default_cwd`` or ``allow_cwd_roots`` never leaves a stale policy.
+    _cwd_policy: Optional[_CwdPolicy] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._current_cwd_policy()
+
+    @property
+    def resolved_default_cwd(self) -> Path:
+        return self._current_cwd_policy()[1]
+
+    @property
+    def resolved_allow_cwd_roots(self) -> Tuple[Path, ...]:
+        return self._current_cwd_policy()[2]
+
+    @property
+    def allow_cwd_prefixes(self) -> Tuple[str, ...]:
+        """Resolved roots as strings ending in a separator, for one ``str.startswith`` check."""
+        return self._current_cwd_policy()[3]
+
+    def _current_cwd_policy(self) -> _CwdPolicy:
+        source = (self.default_cwd, tuple(self.allow_cwd_roots))
+        policy = self._cwd_policy
+        if policy is None or policy[0] != source:
+            roots = tuple(root.expanduser().resolve() for root in source[1])
+            policy = (
+                source,
+                source[0].expanduser().resolve(),
+                roots,
+                tuple(os.path.join(os.fspath(root), "") for root in roots),
+            )
+            self._cwd_policy = policy
+        return policy
 
     @classmethod
     def load(
@@ -73,13 +168,18 @@ class Config:
 
         raw_config = _default_dict()
 
-        file_config, resolved_config_path = _load_from_file(config_path=config_path, base_dir=base_dir)
+        env_values = env if env is not None else os.environ
+        use_sidecar = env_values.get(CONFIG_CACHE_ENV, "").lower() in _TRUTHY
+
+        file_config, resolved_config_path = _load_from_file(
+            config_path=config_path, base_dir=base_dir, use_sidecar=use_sidecar
+        )
         _merge_dict(raw_config, file_config)
         config_dir = resolved_config_path.parent if resolved_config_path is not None else base_dir
 
-        env_config = _load_from_env(env if env is not None else os.environ)
-        for dotted_key, value in env_config.items():
-            _apply_override(raw_config, dotted_key, value)
+        env_config = _load_from_env(env_values)
+        for key_parts, value in env_config.items():
+            _apply_override(raw_config, key_parts, value)
 
         if cli_overrides:
             for key, value in cli_overrides.items():
@@ -98,15 +198,16 @@ def _default_dict() -> Dict[str, Any]:
             r"^grep\b",
             r"^rg\b",
         ],
-        "default_cwd": str(Path("~").expanduser()),
-        "audit_log_path": str(Path("~/.local/state/mcp-shell-aliases/audit.log").expanduser()),
+        "default_cwd": _HOME_STR,
+        "audit_log_path": _DEFAULT_AUDIT_LOG_STR,
         "enable_hot_reload": True,
+        "hot_reload_interval_seconds": 0.0,
         "execution": {
             "max_stdout_bytes": 10_000,
             "max_stderr_bytes": 10_000,
             "default_timeout_seconds": 20,
         },
-        "allow_cwd_roots": [str(Path("~").expanduser())],
+        "allow_cwd_roots": [_HOME_STR],
         "transport": "stdio",
         "http_host": "127.0.0.1",
         "http_port": 3921,
@@ -114,12 +215,22 @@ def _default_dict() -> Dict[str, Any]:
     }
 
 
-def _load_from_file(*, config_path: Optional[Path], base_dir: Path) -> Tuple[Dict[str, Any], Optional[Path]]:
+def _load_from_file(
+    *, config_path: Optional[Path], base_dir: Path, use_sidecar: bool = False
+) -> Tuple[Dict[str, Any], Optional[Path]]:
     candidate_paths: Iterable[Path]
     explicit = config_path is not None
+    dir_mtime: Optional[int] = None
     if config_path is not None:
         candidate_paths = (config_path,)
     else:
+        # One stat of the directory replaces a failed stat per default filename.
+        try:
+            dir_mtime = base_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None and _NEGATIVE_CONFIG_DIRS.get(base_dir) == dir_mtime:
+            return {}, None
         candidate_paths = (base_dir / name for name in DEFAULT_CONFIG_FILENAMES)
 
     for path in candidate_paths:
@@ -128,7 +239,7 @@ def _load_from_file(*, config_path: Optional[Path], base_dir: Path) -> Tuple[Dic
             continue
         try:
             absolute = expanded.resolve()
-            return _read_config_file(expanded), absolute
+            return _read_config_file(expanded, use_sidecar=use_sidecar), absolute
         except Exception as exc:  # pragma: no cover - sanity guard
             raise ConfigError(f"Failed to read config file {expanded}") from exc
 
@@ -137,34 +248,134 @@ def _load_from_file(*, config_path: Optional[Path], base_dir: Path) -> Tuple[Dic
         missing = config_path.expanduser()
         raise ConfigError(f"Config file {missing} not found")
 
+    if dir_mtime is not None and time.time_ns() - dir_mtime > _MTIME_SETTLE_NS:
+        _NEGATIVE_CONFIG_DIRS[base_dir] = dir_mtime
     return {}, None
 
 
-def _read_config_file(path: Path) -> Dict[str, Any]:
-    """Read YAML or JSON configuration."""
-    text = path.read_text(encoding="utf-8")
+def _read_config_file(path: Path, *, use_sidecar: bool = False) -> Dict[str, Any]:
+    """Read YAML or JSON configuration, reusing the previous parse if the file is unchanged.
+
+    ``use_sidecar`` opts YAML files into the JSON sidecar cache (``CONFIG_CACHE_ENV``).
+    """
+    stat = path.stat()
+    cached = _PARSE_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _PARSE_CACHE.move_to_end(path)
+        return _copy_mapping(cached[2])
 
-    if path.suffix.lower() in {".yaml", ".yml", ""}:
-        return _ensure_mapping(yaml.safe_load(text) or {}, path)
+    use_sidecar = use_sidecar and path.suffix.lower() in {".yaml", ".yml", ""}
+    data = _read_sidecar(path, stat) if use_sidecar else None
+    if data is None:
+        data = _parse_config_file(path)
+        if use_sidecar:
+            _write_sidecar(path, stat, data)
+    _PARSE_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+    _PARSE_CACHE.move_to_end(path)
+    while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+        _PARSE_CACHE.popitem(last=False)
+    # Callers merge into the result, so never hand out the cached mapping itself.
+    return _copy_mapping(data)
 
-    if path.suffix.lower() == ".json":
-        import json
 
-        return _ensure_mapping(json.loads(text), path)
+def _copy_mapping(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: _copy_tree(value) for key, value in data.items()}
+
+
+def _copy_tree(value: Any) -> Any:
+    """Copy parsed config data; plain dicts, lists and scalars skip ``deepcopy``'s memo."""
+    kind = type(value)
+    if kind is dict:
+        return {key: _copy_tree(item) for key, item in value.items()}
+    if kind is list:
+        return [_copy_tree(item) for item in value]
+    if kind in _IMMUTABLE_SCALARS:
+        return value
+    return copy.deepcopy(value)
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + _SIDECAR_SUFFIX)
+
+
+def _read_sidecar(path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    try:
+        cached = loads(_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("mtime_ns") != stat.st_mtime_ns
+        or cached.get("size") != stat.st_size
+        or not isinstance(cached.get("data"), dict)
+    ):
+        return None
+    data: Dict[str, Any] = cached["data"]
+    return data
+
+
+def _write_sidecar(path: Path, stat: os.stat_result, data: Dict[str, Any]) -> None:
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data}
+    try:
+        payload = dumps_compact(entry)
+    except (TypeError, ValueError):
+        return
+    # YAML-only types (dates, sets, binary) would not survive the round trip; skip those.
+    if loads(payload) != entry:
+        return
+
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, sidecar)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _parse_config_file(path: Path) -> Dict[str, Any]:
+    suffix = path.suffix.lower()
+    if suffix in {".yaml", ".yml", ""}:
+        import yaml
+
+        if path.stat().st_size > _YAML_STREAM_THRESHOLD:
+            with path.open("rb") as handle:
+                loaded = yaml.load(handle, Loader=_yaml_safe_loader())
+        else:
+            loaded = yaml.load(path.read_text(encoding="utf-8"), Loader=_yaml_safe_loader())
+        return _ensure_mapping(loaded or {}, path)
+
+    if suffix == ".json":
+        # Both JSON backends accept UTF-8 bytes, so skip the separate decode pass.
+        return _ensure_mapping(loads(path.read_bytes()), path)
 
     raise ConfigError(f"Unsupported config extension: {path.suffix}")
 
 
+@functools.lru_cache(maxsize=None)
+def _yaml_safe_loader() -> Any:
+    """Return PyYAML's LibYAML-backed safe loader when available, else the Python one.
+
+    PyYAML is imported lazily so JSON-only and file-less startups never load it.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def _ensure_mapping(value: Any, path: Path) -> Dict[str, Any]:
     if not isinstance(value, MutableMapping):
         raise ConfigError(f"Config file {path} must contain a mapping at top level")
     return dict(value)
 
 
-def _load_from_env(env: Mapping[str, str]) -> Dict[str, Any]:
-    results: Dict[str, Any] = {}
+def _load_from_env(env: Mapping[str, str]) -> Dict[Tuple[str, ...], Any]:
+    results: Dict[Tuple[str, ...], Any] = {}
 
-    for key, target in _env_key_map().items():
+    for key, target in _ENV_KEY_MAP.items():
         if key not in env:
             continue
         results[target] = _parse_env_value(target, env[key])
@@ -172,58 +383,69 @@ def _load_from_env(env: Mapping[str, str]) -> Dict[str, Any]:
     return results
 
 
-def _env_key_map() -> Dict[str, str]:
-    return {
-        f"{ENV_PREFIX}ALIAS_FILES": "alias_files",
-        f"{ENV_PREFIX}ALLOW_PATTERNS": "allow_patterns",
-        f"{ENV_PREFIX}DEFAULT_CWD": "default_cwd",
-        f"{ENV_PREFIX}AUDIT_LOG_PATH": "audit_log_path",
-        f"{ENV_PREFIX}ENABLE_HOT_RELOAD": "enable_hot_reload",
-        f"{ENV_PREFIX}MAX_STDOUT_BYTES": "execution.max_stdout_bytes",
-        f"{ENV_PREFIX}MAX_STDERR_BYTES": "execution.max_stderr_bytes",
-        f"{ENV_PREFIX}DEFAULT_TIMEOUT_SECONDS": "execution.default_timeout_seconds",
-        f"{ENV_PREFIX}ALLOW_CWD_ROOTS": "allow_cwd_roots",
-        f"{ENV_PREFIX}TRANSPORT": "transport",
-        f"{ENV_PREFIX}HTTP_HOST": "http_host",
-        f"{ENV_PREFIX}HTTP_PORT": "http_port",
-        f"{ENV_PREFIX}HTTP_PATH": "http_path",
-    }
+def _parse_env_value(target: Tuple[str, ...], raw: str) -> Any:
+    parser = _ENV_PARSERS.get(target)
+    if parser is None:
+        parser = _env_parser(target)
+    convert, error = parser
+    if convert is None:
+        return raw
+    try:
+        return convert(raw)
+    except ValueError as exc:
+        raise ConfigError(error) from exc
 
 
-def _parse_env_value(target: str, raw: str) -> Any:
-    if target in {"alias_files", "allow_patterns", "allow_cwd_roots"}:
-        return [item for item in raw.split(":") if item]
+def _env_parser(target: Tuple[str, ...]) -> Tuple[Optional[Callable[[str], Any]], str]:
+    """Return the converter for an env value at ``target`` and its error message."""
+    if len(target) == 1:
+        name = target[0]
+        if name in _ENV_LIST_KEYS:
+            return _split_env_list, ""
+        if name == "enable_hot_reload":
+            return _env_flag, ""
+        if name in _ENV_STRING_KEYS:
+            return None, ""
+        if name == "hot_reload_interval_seconds":
+            return float, "Hot reload interval must be a number"
+        if name == "http_port":
+            return int, "HTTP port must be an integer"
 
-    if target == "enable_hot_reload":
-        return raw.lower() in {"1", "true", "yes", "on"}
-    if target in {"transport", "http_host", "http_path", "default_cwd", "audit_log_path"}:
-        return raw
+    if target[0] == "execution":
+        return int, f"Environment value for {'.'.join(target)} must be an integer"
 
-    if target.startswith("execution."):
-        try:
-            return int(raw)
-        except ValueError as exc:
-            raise ConfigError(f"Environment value for {target} must be an integer") from exc
-    if target == "http_port":
-        try:
-            return int(raw)
-        except ValueError as exc:
-            raise ConfigError("HTTP port must be an integer") from exc
+    return None, ""
 
-    return raw
 
+def _split_env_list(raw: str) -> List[str]:
+    return [item for item in raw.split(":") if item]
 
-def _merge_dict(target: Dict[str, Any], source: Mapping[str, Any]) -> None:
-    for key, value in source.items():
-        existing = target.get(key)
-        if isinstance(value, Mapping) and isinstance(existing, dict):
-            _merge_dict(existing, value)
-        else:
-            target[key] = value
 
+def _env_flag(raw: str) -> bool:
+    return raw.lower() in _TRUTHY
 
-def _apply_override(target: Dict[str, Any], dotted_key: str, value: Any) -> None:
-    parts = dotted_key.split(".")
+
+# Converters for every mapped env key, resolved once instead of per lookup.
+_ENV_PARSERS: Dict[Tuple[str, ...], Tuple[Optional[Callable[[str], Any]], str]] = {
+    target: _env_parser(target) for target in _ENV_KEY_MAP.values()
+}
+
+
+def _merge_dict(target: Dict[str, Any], source: Mapping[str, Any]) -> None:
+    pending = [(target, source)]
+    while pending:
+        into, items = pending.pop()
+        for key, value in items.items():
+            existing = into.get(key, _MISSING)
+            # Test the concrete ``dict`` first; most leaves are scalars and skip the ABC check.
+            if type(existing) is dict and (type(value) is dict or isinstance(value, Mapping)):
+                pending.append((existing, value))
+            elif existing is _MISSING or existing != value:
+                into[key] = value
+
+
+def _apply_override(target: Dict[str, Any], key: str | Tuple[str, ...], value: Any) -> None:
+    parts = key.split(".") if isinstance(key, str) else key
     current: Dict[str, Any] = target
     for part in parts[:-1]:
         next_value = current.get(part)
@@ -231,35 +453,59 @@ def _apply_override(target: Dict[str, Any], dotted_key: str, value: Any) -> None
             next_value = {}
             current[part] = next_value
         elif not isinstance(next_value, dict):
-            raise ConfigError(f"Cannot override nested key {dotted_key}")
+            raise ConfigError(f"Cannot override nested key {'.'.join(parts)}")
         current = next_value
-    current[parts[-1]] = value
+    leaf = parts[-1]
+    existing = current.get(leaf)
+    if type(existing) is dict and (type(value) is dict or isinstance(value, Mapping)):
+        # Overriding a section (e.g. ``execution``) only replaces the keys given.
+        _merge_dict(existing, value)
+    elif type(value) is list:
+        # Caller-owned lists (``cli_overrides``) are copied so the Config never aliases them.
+        current[leaf] = list(value)
+    else:
+        current[leaf] = value
+
+
+def _expand_home(value: str | os.PathLike[str]) -> Path:
+    """``Path(value).expanduser()``, skipping the expansion for values without ``~``."""
+    path = Path(value)
+    return path.expanduser() if os.fspath(value)[:1] == "~" else path
 
 
 def _resolve_path(value: str, *, base_dir: Path) -> Path:
-    expanded = Path(value).expanduser()
-    candidate = expanded if expanded.is_absolute() else base_dir / expanded
-    try:
-        return candidate.resolve(strict=False)
-    except OSError:
-        return candidate
+    # Lexical normalization only: alias files are read, not policed, so there is no need
+    # to pay for realpath's per-component lstat walk to canonicalize symlinks.
+    expanded = os.path.expanduser(value)
+    if not os.path.isabs(expanded):
+        expanded = os.path.join(base_dir, expanded)
+    return Path(os.path.abspath(expanded))
 
 
 def _build_config(raw: Dict[str, Any], *, config_dir: Path) -> Config:
     alias_files = [_resolve_path(p, base_dir=config_dir) for p in raw.get("alias_files", [])]
     if "deny_patterns" in raw:
         raise ConfigError("deny_patterns is no longer supported; remove it and rely on allow_patterns only.")
-    default_cwd = Path(raw.get("default_cwd", "~")).expanduser()
-    audit_log_path = Path(raw.get("audit_log_path", "~/.local/state/mcp-shell-aliases/audit.log")).expanduser()
-    allow_cwd_roots = [Path(p).expanduser() for p in raw.get("allow_cwd_roots", [])]
+    default_cwd = _expand_home(raw.get("default_cwd", _HOME_STR))
+    audit_log_path = _expand_home(raw.get("audit_log_path", _DEFAULT_AUDIT_LOG_STR))
+    allow_cwd_roots = [_expand_home(p) for p in raw.get("allow_cwd_roots", [])]
 
-    execution_dict = raw.get("execution", {})
+    # ``Config.load`` parses files fresh and copies override lists, so ``raw`` owns its lists.
+    allow_patterns = raw.get("allow_patterns") or []
+    if not isinstance(allow_patterns, list):
+        allow_patterns = list(allow_patterns)
+
+    execution_dict = raw.get("execution") or {}
     execution = ExecutionLimits(
         max_stdout_bytes=int(execution_dict.get("max_stdout_bytes", 10_000)),
         max_stderr_bytes=int(execution_dict.get("max_stderr_bytes", 10_000)),
         default_timeout_seconds=int(execution_dict.get("default_timeout_seconds", 20)),
     )
 
+    hot_reload_interval = float(raw.get("hot_reload_interval_seconds", 0.0))
+    if hot_reload_interval < 0:
+        raise ConfigError("hot_reload_interval_seconds must not be negative")
+
     transport = str(raw.get("transport", "stdio")).lower()
     http_host = str(raw.get("http_host", "127.0.0.1"))
     http_port = int(raw.get("http_port", 3921))
@@ -269,10 +515,11 @@ def _build_config(raw: Dict[str, Any], *, config_dir: Path) -> Config:
 
     return Config(
         alias_files=alias_files,
-        allow_patterns=list(raw.get("allow_patterns", [])),
+        allow_patterns=allow_patterns,
         default_cwd=default_cwd,
         audit_log_path=audit_log_path,
         enable_hot_reload=bool(raw.get("enable_hot_reload", True)),
+        hot_reload_interval_seconds=hot_reload_interval,
         execution=execution,
         allow_cwd_roots=allow_cwd_roots or [default_cwd],
         transport=transport,
@@ -19,17 +19,33 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import io
 import os
 import re
+import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, Tuple
 
 from .aliases import Alias
 from .config import Config
 from .errors import CwdNotAllowedError
+from .serialization import dumps_compact
+
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Characters that make bash do more than split on blanks, plus any whitespace other
+# than space and tab (newlines separate commands; str.split knows more blanks than bash).
+_SHELL_SYNTAX = re.compile(r"""[|&;<>()$`\\"'*?\[\]{}~#!]|[^\S \t]""")
+
+# Last formatted UTC second, reused by _utc_timestamp until the second changes.
+_TIMESTAMP_SECOND: Tuple[int, str] = (-1, "")
+
+# Audit log files stay open for the life of the process, keyed by path.
+_AUDIT_HANDLES: Dict[Path, io.FileIO] = {}
+_AUDIT_HANDLES_LOCK = threading.Lock()
 
 
 @dataclass(slots=True)
@@ -68,6 +84,7 @@ async def execute_alias(
     dry_run: bool,
     requested_cwd: Path | None,
     timeout_override: int | None,
+    env_template: Mapping[str, str] | None = None,
 ) -> ExecutionResult:
     command = _build_command(alias.expansion, args)
     cwd = _resolve_cwd(requested_cwd, config)
@@ -85,28 +102,37 @@ async def execute_alias(
             dry_run=True,
         )
 
-    env = _build_env(os.environ, config, cwd)
+    if env_template is None:
+        env = _build_env(os.environ, config, cwd)
+    else:
+        env = dict(env_template)
+        env["PWD"] = str(cwd)
     timeout_seconds = timeout_override or config.execution.default_timeout_seconds
 
-    process = await asyncio.create_subprocess_exec(
-        "/bin/bash",
-        "-lc",
-        command,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        cwd=str(cwd),
-        env=env,
+    process = None
+    argv = _direct_argv(command)
+    if argv is not None:
+        try:
+            process = await _spawn(argv, cwd, env)
+        except OSError:
+            # Not directly executable (a login-profile function, a script without a
+            # shebang, ...); bash decides what the command means.
+            process = None
+    if process is None:
+        process = await _spawn(["/bin/bash", "-lc", command], cwd, env)
+
+    # Drain both pipes as the child writes so memory stays bounded by the output limits
+    # rather than by whatever the alias happens to print.
+    collect = asyncio.gather(
+        _read_capped(process.stdout, config.execution.max_stdout_bytes),
+        _read_capped(process.stderr, config.execution.max_stderr_bytes),
+        process.wait(),
     )
-
-    try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(
-            process.communicate(), timeout=timeout_seconds
-        )
-        timed_out = False
-    except asyncio.TimeoutError:
+    done, _ = await asyncio.wait({collect}, timeout=timeout_seconds)
+    timed_out = not done
+    if timed_out and process.returncode is None:
         process.kill()
-        stdout_bytes, stderr_bytes = await process.communicate()
-        timed_out = True
+    stdout_bytes, stderr_bytes, _ = await collect
 
     stdout, stdout_truncated = _decode_and_truncate(stdout_bytes, config.execution.max_stdout_bytes)
     stderr, stderr_truncated = _decode_and_truncate(stderr_bytes, config.execution.max_stderr_bytes)
@@ -136,36 +162,56 @@ def _build_command(expansion: str, args: Iterable[str] | str | None) -> str:
             return f"{expansion} {arg_suffix}"
         return expansion
 
-    arg_parts: List[str] = []
-    for arg in args:
-        text = str(arg)
-        if text:
-            arg_parts.append(text)
-    if arg_parts:
-        return f"{expansion} {' '.join(arg_parts)}"
+    arg_suffix = " ".join(text for text in map(str, args) if text)
+    if arg_suffix:
+        return f"{expansion} {arg_suffix}"
     return expansion
 
 
+def _direct_argv(command: str) -> List[str] | None:
+    """Return the argv for ``command`` when it can be run without a shell.
+
+    Only plain words whose program is given as a path (``/usr/bin/git``, ``./build``)
+    qualify. Bash runs such a program without consulting functions, builtins, or the
+    login ``PATH``, so skipping it changes nothing but the profile's exported variables.
+    Bare names keep going through ``/bin/bash -lc``, whose login profile decides what
+    they resolve to.
+    """
+    if _SHELL_SYNTAX.search(command):
+        return None
+    argv = command.split()
+    if not argv or "/" not in argv[0] or "=" in argv[0]:
+        return None
+    return argv
+
+
+async def _spawn(argv: List[str], cwd: Path, env: Mapping[str, str]) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd),
+        env=env,
+    )
+
+
 def _resolve_cwd(requested: Path | None, config: Config) -> Path:
     if requested is None:
-        return config.default_cwd.expanduser().resolve()
+        return config.resolved_default_cwd
 
     resolved = requested.expanduser().resolve()
-    allowed_roots = [root.expanduser().resolve() for root in config.allow_cwd_roots]
 
-    for root in allowed_roots:
-        if _is_within(resolved, root):
-            return resolved
+    # Appending a separator lets a root match itself as well as its descendants.
+    if os.path.join(os.fspath(resolved), "").startswith(config.allow_cwd_prefixes):
+        return resolved
 
     raise CwdNotAllowedError(f"Requested cwd {resolved} is outside allowed roots")
 
 
-def _is_within(path: Path, root: Path) -> bool:
-    try:
-        path.relative_to(root)
-        return True
-    except ValueError:
-        return False
+def build_env_template(config: Config, base_env: Mapping[str, str] | None = None) -> Dict[str, str]:
+    """Build the scrubbed execution environment once so calls only need to set ``PWD``."""
+    base = os.environ if base_env is None else base_env
+    return _build_env(base, config, config.resolved_default_cwd)
 
 
 def _build_env(base_env: Mapping[str, str], config: Config, cwd: Path) -> Dict[str, str]:
@@ -184,6 +230,24 @@ def _build_env(base_env: Mapping[str, str], config: Config, cwd: Path) -> Dict[s
     return env
 
 
+async def _read_capped(stream: asyncio.StreamReader | None, limit: int) -> bytes:
+    """Read ``stream`` to EOF, retaining at most ``limit + 1`` bytes.
+
+    The extra byte lets ``_decode_and_truncate`` report truncation; everything past it
+    is read and discarded so the child never blocks on a full pipe.
+    """
+    if stream is None:
+        return b""
+    keep = limit + 1
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            return bytes(buffer)
+        if len(buffer) < keep:
+            buffer += chunk[: keep - len(buffer)]
+
+
 def _decode_and_truncate(data: bytes, limit: int) -> Tuple[str, bool]:
     if len(data) <= limit:
         return data.decode("utf-8", errors="replace"), False
@@ -201,7 +265,7 @@ def write_audit_log(
     result: ExecutionResult,
 ) -> None:
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_timestamp(),
         "alias": alias.name,
         "safe": alias.safe,
         "args": _format_args(args),
@@ -212,15 +276,53 @@ def write_audit_log(
         "dryRun": result.dry_run,
     }
 
-    payload = json.dumps(_redact(entry), separators=(",", ":"))
+    payload = dumps_compact(_redact(entry))
+
+    # One unbuffered write per entry: O_APPEND keeps concurrent lines intact and
+    # nothing is left sitting in a userspace buffer at shutdown.
+    _audit_handle(config.audit_log_path).write(payload + b"\n")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ``YYYY-MM-DDTHH:MM:SS.mmmZ``."""
+    global _TIMESTAMP_SECOND
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if second != _TIMESTAMP_SECOND[0]:
+        _TIMESTAMP_SECOND = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{_TIMESTAMP_SECOND[1]}.{nanos // 1_000_000:03d}Z"
+
+
+def _audit_handle(path: Path) -> io.FileIO:
+    handle = _AUDIT_HANDLES.get(path)
+    if handle is None:
+        # Writers in other threads must not race to open (and leak) a second handle.
+        with _AUDIT_HANDLES_LOCK:
+            handle = _AUDIT_HANDLES.get(path)
+            if handle is None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                handle = io.FileIO(path, "a")
+                _AUDIT_HANDLES[path] = handle
+    return handle
+
+
+def close_audit_logs() -> None:
+    """Close audit log handles opened by :func:`write_audit_log`."""
+    with _AUDIT_HANDLES_LOCK:
+        while _AUDIT_HANDLES:
+            _, handle = _AUDIT_HANDLES.popitem()
+            handle.close()
+
 
-    path = config.audit_log_path
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as handle:
-        handle.write(payload + "\n")
+atexit.register(close_audit_logs)
 
 
-_SECRET_PATTERN = re.compile(r"(?i)(token|secret|password)[^\s]*")
+_SECRET_TOKENS = ("token", "secret", "password", "apikey", "api_key", "api-key", "authorization")
+# A keyword-bearing word is redacted whole; when it ends in ``=`` or ``:`` the value that
+# follows after whitespace (``Authorization: Bearer abc``) goes with it.
+_SECRET_PATTERN = re.compile(
+    r"(?i)(?:token|secret|password|api[_-]?key|authorization)[^\s]*"
+    r"(?:(?<=[=:])\s+(?:bearer\s+)?[^\s]+)?"
+)
 
 
 def _format_args(args: Iterable[str] | str | None) -> str:
@@ -232,15 +334,23 @@ def _format_args(args: Iterable[str] | str | None) -> str:
 
 
 def _redact(entry: Dict[str, object]) -> Dict[str, object]:
-    redacted: Dict[str, object] = {}
-    for key, value in entry.items():
-        if isinstance(value, str):
-            redacted[key] = _SECRET_PATTERN.sub("<redacted>", value)
-        elif isinstance(value, list):
-            redacted[key] = [
-                _SECRET_PATTERN.sub("<redacted>", item) if isinstance(item, str) else item
-                for item in value
-            ]
-        else:
-            redacted[key] = value
-    return redacted
+    return {key: _redact_value(value) for key, value in entry.items()}
+
+
+def _redact_value(value: object) -> object:
+    if isinstance(value, str):
+        return _redact_str(value)
+    if isinstance(value, list):
+        return [_redact_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _redact_value(item) for key, item in value.items()}
+    return value
+
+
+def _redact_str(value: str) -> str:
+    # Cheap substring pre-filter: most audit fields never mention a secret keyword,
+    # so skip the regex scan entirely for them.
+    folded = value.casefold()
+    if not any(token in folded for token in _SECRET_TOKENS):
+        return value
+    return _SECRET_PATTERN.sub("<redacted>", value)
@@ -18,20 +18,63 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
-from dataclasses import dataclass
-from typing import Iterable, List, Pattern
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern
 
 
 logger = logging.getLogger(__name__)
 
+# Backreferences and group conditionals such as ``(?(1)...)`` change meaning once patterns
+# share one group namespace.
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+# Inline global flags such as ``(?i)``. Python 3.10 accepts them anywhere with only a
+# warning and applies them to the whole regex, so a fused alternation would widen them
+# to every other pattern.
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+# Allow patterns of the form ``^word\b`` match exactly when the expansion's leading run
+# of word characters is ``word``, so they can be answered with a set lookup. Patterns that
+# only start that way can match nothing else, so they are searched for that head alone.
+_LITERAL_HEAD_PATTERN = re.compile(r"\^(\w+)\\b(?![?*+{])")
+_HEAD_WORD = re.compile(r"\w+")
+_MAX_CACHED_VERDICTS = 4096
+
 
 @dataclass(slots=True)
 class SafetyClassifier:
     """Classifies alias expansions as safe or unsafe using allowlist-only rules."""
 
     allow_patterns: List[Pattern[str]]
+    literal_heads: FrozenSet[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    patterns_by_head: Dict[str, List[Pattern[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    residual_patterns: List[Pattern[str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    combined: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
+    # Verdicts by expansion; the same expansions recur across files and reloads.
+    verdicts: Dict[str, bool] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        heads = set()
+        for pattern in self.allow_patterns:
+            text = pattern.pattern
+            literal = _LITERAL_HEAD_PATTERN.match(text)
+            if literal is None:
+                self.residual_patterns.append(pattern)
+            elif literal.end() == len(text):
+                heads.add(literal.group(1))
+            elif _GLOBAL_FLAGS.search(text) or _has_top_level_alternation(text):
+                self.residual_patterns.append(pattern)
+            else:
+                self.patterns_by_head.setdefault(literal.group(1), []).append(pattern)
+        self.literal_heads = frozenset(heads)
+        self.combined = _combine_patterns(self.residual_patterns)
 
     @classmethod
     def from_strings(cls, allow_patterns: Iterable[str]) -> "SafetyClassifier":
@@ -43,7 +86,27 @@ class SafetyClassifier:
         if not self.allow_patterns:
             return False
 
-        return any(pattern.search(expansion) for pattern in self.allow_patterns)
+        verdict = self.verdicts.get(expansion)
+        if verdict is None:
+            if len(self.verdicts) >= _MAX_CACHED_VERDICTS:
+                self.verdicts.clear()
+            verdict = self.verdicts[expansion] = self._match(expansion)
+        return verdict
+
+    def _match(self, expansion: str) -> bool:
+        if self.literal_heads or self.patterns_by_head:
+            match = _HEAD_WORD.match(expansion)
+            if match is not None:
+                head = match.group()
+                if head in self.literal_heads:
+                    return True
+                candidates = self.patterns_by_head.get(head)
+                if candidates and any(pattern.search(expansion) for pattern in candidates):
+                    return True
+
+        if self.combined is not None:
+            return self.combined.search(expansion) is not None
+        return any(pattern.search(expansion) for pattern in self.residual_patterns)
 
 
 def _normalize_regex(pattern: str) -> str:
@@ -60,12 +123,69 @@ def _normalize_regex(pattern: str) -> str:
     return pattern
 
 
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Return True if ``pattern`` contains a ``|`` outside any group or character class."""
+    depth = 0
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            index += 1
+            if index < length and pattern[index] == "^":
+                index += 1
+            if index < length and pattern[index] == "]":
+                index += 1
+            while index < length and pattern[index] != "]":
+                index += 2 if pattern[index] == "\\" else 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+        index += 1
+    return False
+
+
 def _compile_patterns(patterns: Iterable[str]) -> List[Pattern[str]]:
     compiled: List[Pattern[str]] = []
     for raw in patterns:
-        normalized = _normalize_regex(raw)
-        try:
-            compiled.append(re.compile(normalized))
-        except re.error:
+        pattern = _compile_one(raw)
+        if pattern is None:
             logger.warning("Skipping invalid regex pattern '%s'", raw)
+        else:
+            compiled.append(pattern)
     return compiled
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_one(raw: str) -> Optional[Pattern[str]]:
+    """Normalize and compile ``raw``; classifiers rebuilt from the same config reuse it."""
+    try:
+        return re.compile(_normalize_regex(raw))
+    except re.error:
+        return None
+
+
+def _combine_patterns(patterns: List[Pattern[str]]) -> Optional[Pattern[str]]:
+    """Fuse the allowlist into one alternation so ``is_safe`` is a single regex search.
+
+    Returns ``None`` when the patterns cannot be fused without changing their
+    meaning (backreferences, group conditionals, inline global flags, duplicate group
+    names); the classifier then falls back to searching each pattern in turn.
+    """
+    if len(patterns) < 2:
+        return patterns[0] if patterns else None
+    if any(
+        _BACKREFERENCE.search(pattern.pattern) or _GLOBAL_FLAGS.search(pattern.pattern)
+        for pattern in patterns
+    ):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    except re.error:
+        return None
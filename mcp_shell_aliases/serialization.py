@@ -0,0 +1,66 @@
+# Gemini Shell Aliases - A tool for creating and managing shell aliases.
+# Copyright (C) 2025 Heston Hamilton
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""JSON helpers that prefer orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, cast
+
+try:
+    import orjson
+
+    _orjson: Any = orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
+
+
+def dumps_compact(value: Any) -> bytes:
+    """Serialize ``value`` to compact UTF-8 JSON bytes."""
+
+    if _orjson is not None:
+        try:
+            return cast(bytes, _orjson.dumps(value))
+        except TypeError:
+            # orjson rejects lone surrogates (e.g. undecodable path names); the stdlib
+            # encoder escapes them.
+            pass
+    return json.dumps(value, separators=(",", ":")).encode("ascii")
+
+
+def dumps_pretty(value: Any) -> str:
+    """Serialize ``value`` to JSON indented by two spaces."""
+
+    if _orjson is not None:
+        try:
+            return cast(bytes, _orjson.dumps(value, option=_orjson.OPT_INDENT_2)).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2)
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from ``bytes`` or ``str``."""
+
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except ValueError:
+            # Includes escaped lone surrogates, which orjson rejects; the stdlib decides.
+            pass
+    return json.loads(data)
@@ -19,23 +19,25 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
 import signal
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import FrameType
-from typing import Any, Dict, List, Optional
-
-from fastmcp import FastMCP
-from fastmcp.exceptions import ToolError
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 from . import __version__
 from .aliases import Alias, AliasCatalog, build_catalog
 from .config import Config
 from .errors import AliasNotFoundError, CwdNotAllowedError
-from .execution import execute_alias, write_audit_log
+from .execution import build_env_template, execute_alias, write_audit_log
 from .safety import SafetyClassifier
+from .serialization import dumps_pretty
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
@@ -47,19 +49,45 @@ class AliasRuntime:
     config: Config
     classifier: SafetyClassifier
     catalog: AliasCatalog
+    env_template: Dict[str, str] = field(default_factory=dict)
+    file_stamps: Tuple[Optional[Tuple[int, int]], ...] = ()
+    parse_cache: Dict[Path, Tuple[int, int, List[Alias]]] = field(default_factory=dict)
+    next_reload_check: float = 0.0
+    # Catalog views tagged with the catalog they were built from; a reload swaps the
+    # catalog object, which invalidates them.
+    catalog_dicts_cache: Optional[Tuple[AliasCatalog, List[Dict[str, Any]]]] = None
+    catalog_json_cache: Optional[Tuple[AliasCatalog, str]] = None
 
     @classmethod
     def build(cls, config: Config) -> "AliasRuntime":
         classifier = SafetyClassifier.from_strings(config.allow_patterns)
-        catalog = build_catalog(config.alias_files, classifier)
-        return cls(config=config, classifier=classifier, catalog=catalog)
+        file_stamps = _stat_alias_files(config.alias_files)
+        parse_cache: Dict[Path, Tuple[int, int, List[Alias]]] = {}
+        catalog = build_catalog(config.alias_files, classifier, parse_cache)
+        return cls(
+            config=config,
+            classifier=classifier,
+            catalog=catalog,
+            env_template=build_env_template(config),
+            file_stamps=file_stamps,
+            parse_cache=parse_cache,
+        )
 
     def refresh(self) -> None:
         if not self.config.enable_hot_reload:
             return
+        now = time.monotonic()
+        if now < self.next_reload_check:
+            return
+        self.next_reload_check = now + self.config.hot_reload_interval_seconds
+        # A stat per alias file is far cheaper than re-parsing them; only rebuild
+        # when a file's mtime or size (or existence) has changed.
+        file_stamps = _stat_alias_files(self.config.alias_files)
+        if file_stamps == self.file_stamps:
+            return
         logger.debug("Reloading alias catalog due to hot reload")
-        self.classifier = SafetyClassifier.from_strings(self.config.allow_patterns)
-        self.catalog = build_catalog(self.config.alias_files, self.classifier)
+        self.catalog = build_catalog(self.config.alias_files, self.classifier, self.parse_cache)
+        self.file_stamps = file_stamps
 
     def get_alias(self, name: str) -> Alias:
         self.refresh()
@@ -72,8 +100,42 @@ class AliasRuntime:
         self.refresh()
         return self.catalog.all()
 
+    def catalog_dicts(self) -> List[Dict[str, Any]]:
+        """Return catalog entries as payload dicts, rebuilt only after a reload."""
+        self.refresh()
+        cached = self.catalog_dicts_cache
+        if cached is None or cached[0] is not self.catalog:
+            cached = (self.catalog, [alias.to_payload() for alias in self.catalog.values()])
+            self.catalog_dicts_cache = cached
+        return cached[1]
+
+    def catalog_json(self) -> str:
+        """Return the catalog serialized as indented JSON, re-encoded only after a reload."""
+        dicts = self.catalog_dicts()
+        cached = self.catalog_json_cache
+        if cached is None or cached[0] is not self.catalog:
+            cached = (self.catalog, dumps_pretty(dicts))
+            self.catalog_json_cache = cached
+        return cached[1]
+
+
+def _stat_alias_files(paths: Iterable[Path]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    stamps: List[Optional[Tuple[int, int]]] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
 
 def create_app(config: Config) -> FastMCP:
+    # FastMCP pulls in a large dependency tree; import it only once a server is built.
+    from fastmcp import FastMCP
+    from fastmcp.exceptions import ToolError
+
     runtime = AliasRuntime.build(config)
     server = FastMCP(
         "shell-aliases",
@@ -81,21 +143,6 @@ def create_app(config: Config) -> FastMCP:
         version=__version__,
     )
 
-    def example_for_alias(alias: Alias) -> str:
-        base = f'alias.exec {{"name":"{alias.name}","args":"","dryRun": true}}'
-        if alias.safe:
-            return base
-        return f'{base}  # unsafe aliases only support dry runs'
-
-    def alias_to_payload(alias: Alias) -> Dict[str, Any]:
-        return {
-            "name": alias.name,
-            "expansion": alias.expansion,
-            "safe": alias.safe,
-            "sourceFile": str(alias.source_file),
-            "example": example_for_alias(alias),
-        }
-
     @server.tool(name="alias.exec", description="Execute or dry-run a configured shell alias.")
     async def alias_exec(
         name: str,
@@ -138,6 +185,7 @@ def create_app(config: Config) -> FastMCP:
                 dry_run=dry_run,
                 requested_cwd=requested_cwd,
                 timeout_override=timeout_override,
+                env_template=runtime.env_template,
             )
         except CwdNotAllowedError as exc:
             raise ToolError(str(exc)) from exc
@@ -157,16 +205,13 @@ def create_app(config: Config) -> FastMCP:
 
     @server.tool(name="alias.catalog", description="Return catalog metadata for all aliases.")
     async def alias_catalog_tool() -> Dict[str, List[Dict[str, Any]]]:
-        aliases = runtime.list_aliases()
         return {
-            "aliases": [alias_to_payload(alias) for alias in aliases],
+            "aliases": runtime.catalog_dicts(),
         }
 
     @server.resource("alias://catalog", description="JSON catalog of available aliases.", mime_type="application/json")
     async def alias_catalog_resource() -> str:
-        aliases = runtime.list_aliases()
-        body = json.dumps([alias_to_payload(alias) for alias in aliases], indent=2)
-        return body
+        return runtime.catalog_json()
 
     @server.resource("alias://{alias_name}", mime_type="application/json")
     async def alias_detail_resource(alias_name: str) -> str:
@@ -175,23 +220,31 @@ def create_app(config: Config) -> FastMCP:
         except AliasNotFoundError as exc:
             raise ToolError(str(exc)) from exc
 
-        body = json.dumps(alias_to_payload(alias), indent=2)
+        body = dumps_pretty(alias.to_payload())
         return body
 
     return server
 
 
+# Signals that request a clean shutdown; SIGTERM is absent on some platforms.
+_SHUTDOWN_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGINT", "SIGTERM") if hasattr(signal, name)
+)
+
+
+# Excluded from coverage: only reachable through real signal delivery.
+def _handle_signal(signum: int, _frame: FrameType | None) -> None:  # pragma: no cover
+    logger.info("Received signal %s; shutting down.", signum)
+    raise KeyboardInterrupt
+
+
 def run(config: Config) -> None:
     server = create_app(config)
     # Install basic signal handlers so we can log clean shutdown intent.
-    def _handle_signal(signum: int, _frame: FrameType | None) -> None:  # pragma: no cover - dependent on signal delivery
-        logger.info("Received signal %s; shutting down.", signum)
-        raise KeyboardInterrupt
-
-    for sig in (signal.SIGINT, signal.SIGTERM):
+    for sig in _SHUTDOWN_SIGNALS:
         try:
             signal.signal(sig, _handle_signal)
-        except (ValueError, AttributeError):  # pragma: no cover - platform limitations
+        except ValueError:  # pragma: no cover - not called from the main thread
             pass
 
     try:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import dataclasses
 from pathlib import Path
 
-from mcp_shell_aliases.aliases import build_catalog
+import pytest
+
+from mcp_shell_aliases.aliases import Alias, build_catalog
 from mcp_shell_aliases.safety import SafetyClassifier
 
 
@@ -31,6 +34,23 @@ def test_parses_aliases(tmp_path: Path) -> None:
     assert aliases["ll"].safe is True
     assert aliases["dangerous"].safe is False
     assert "invalid-name" not in aliases
+    assert aliases["ll"].example == 'alias.exec {"name":"ll","args":"","dryRun": true}'
+    assert aliases["dangerous"].example.endswith("# unsafe aliases only support dry runs")
+    assert aliases["ll"].to_payload() is aliases["ll"].to_payload()
+    assert aliases["ll"].to_payload()["sourceFile"] == str(alias_file)
+
+
+def test_alias_is_immutable_and_hashable(tmp_path: Path) -> None:
+    alias = Alias(name="ll", expansion="ls -al", safe=True, source_file=tmp_path / "aliases")
+    payload = alias.to_payload()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        alias.expansion = "rm -rf /"  # type: ignore[misc]
+
+    same = Alias(name="ll", expansion="ls -al", safe=True, source_file=tmp_path / "aliases")
+    assert alias == same and hash(alias) == hash(same)
+    assert dataclasses.replace(alias, safe=False).to_payload()["safe"] is False
+    assert alias.to_payload() is payload
 
 
 def test_prioritises_last_definition(tmp_path: Path) -> None:
@@ -70,6 +90,26 @@ def test_skips_non_matching_lines(tmp_path: Path) -> None:
     assert all(n != "notanalias" for n in names)
 
 
+def test_parses_raw_bytes_crlf_and_skips_commented_aliases(tmp_path: Path) -> None:
+    alias_file = tmp_path / "aliases"
+    alias_file.write_bytes(
+        b"alias ll='ls -al'\r\n# alias old='ls -1'\r\n\talias la=\"ls -A\"  \r\nalias x='a'b'\r\n"
+        + "alias hi='echo h\u00e9llo'\n".encode("utf-8")
+        + b"alias bad='echo \xff'\n"
+    )
+
+    catalog = build_catalog([alias_file], classifier())
+    expansions = {alias.name: alias.expansion for alias in catalog.all()}
+
+    assert expansions == {
+        "ll": "ls -al",
+        "la": "ls -A",
+        "x": "a'b",
+        "hi": "echo h\u00e9llo",
+        "bad": "echo ",
+    }
+
+
 def test_unescape_double_and_unknown_quote() -> None:
     from mcp_shell_aliases.aliases import _unescape
 
@@ -91,6 +131,22 @@ def test_is_command_available_handles_none_and_builtins(monkeypatch) -> None:
     assert _is_command_available("echo") is True
 
 
+def test_is_command_available_memoizes_lookups(monkeypatch) -> None:
+    import mcp_shell_aliases.aliases as aliases_mod
+
+    calls: list[str] = []
+
+    def fake_which(cmd: str):  # type: ignore[no-untyped-def]
+        calls.append(cmd)
+        return None
+
+    monkeypatch.setattr(aliases_mod.shutil, "which", fake_which)
+    cache: dict[str, bool] = {}
+    assert aliases_mod._is_command_available("gls", cache) is False
+    assert aliases_mod._is_command_available("gls", cache) is False
+    assert calls == ["gls"]
+
+
 def test_does_not_override_with_unavailable_command(tmp_path: Path, monkeypatch) -> None:
     # First defines ll with a widely available command (ls)
     first = tmp_path / "aliases1"
@@ -133,3 +189,34 @@ def test_override_when_both_unavailable_falls_back_to_last(tmp_path: Path, monke
     assert alias is not None
     assert alias.expansion.startswith("bar ")
     assert alias.source_file == b
+
+
+def test_build_catalog_reuses_cached_parse_for_unchanged_files(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.write_text("alias ll='ls -al'\n", encoding="utf-8")
+    second.write_text("alias la='ls -A'\n", encoding="utf-8")
+    cache: dict = {}
+
+    before = {a.name: a for a in build_catalog([first, second], classifier(), cache).all()}
+    second.write_text("alias la='ls -A --color'\n", encoding="utf-8")
+    after = {a.name: a for a in build_catalog([first, second], classifier(), cache).all()}
+
+    assert after["ll"] is before["ll"]
+    assert after["la"].expansion == "ls -A --color"
+
+
+def test_build_catalog_keeps_file_order_across_many_files(tmp_path: Path) -> None:
+    files = []
+    for idx in range(12):
+        path = tmp_path / f"aliases{idx}"
+        path.write_text(f"alias ll='ls -{idx}'\nalias only{idx}='ls'\n", encoding="utf-8")
+        files.append(path)
+
+    catalog = build_catalog(files, classifier())
+
+    alias = catalog.get("ll")
+    assert alias is not None and alias.expansion == "ls -11"
+    assert len(catalog.all()) == 13
+    assert list(catalog.values()) == catalog.all()
+    assert not hasattr(catalog, "__dict__")
@@ -133,3 +133,20 @@ def test_cli_module_entrypoint_calls_main(monkeypatch: pytest.MonkeyPatch) -> No
     runpy.run_module("mcp_shell_aliases.cli", run_name="__main__")
 
     assert called["loaded"] is True and called["run"] is True
+
+
+def test_cli_import_does_not_load_fastmcp() -> None:
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, mcp_shell_aliases.cli, mcp_shell_aliases.server;"
+        " print('fastmcp' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_build_cli_overrides_skips_unset_and_empty_values() -> None:
+    args = cli.parse_args(["--timeout", "9", "--http-host", ""])
+    assert cli.build_cli_overrides(args) == {"execution": {"default_timeout_seconds": 9}}
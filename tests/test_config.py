@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from mcp_shell_aliases.config import Config, ConfigError
+from mcp_shell_aliases.config import Config, ConfigError, ExecutionLimits
 
 
 def test_default_config(tmp_path: Path) -> None:
@@ -101,6 +101,14 @@ def test_json_config(tmp_path: Path) -> None:
     assert config.http_path == "/mcp"
 
 
+def test_json_config_decodes_utf8_bytes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes('{"alias_files": ["/tmp/ålias"]}'.encode("utf-8"))
+
+    config = Config.load(config_path=config_path)
+    assert config.alias_files == [Path("/tmp/ålias")]
+
+
 def test_unsupported_config_extension_raises(tmp_path: Path) -> None:
     bad = tmp_path / "config.txt"
     bad.write_text("alias_files: []\n", encoding="utf-8")
@@ -128,25 +136,27 @@ def test_apply_override_errors_when_overwriting_non_mapping() -> None:
         _apply_override(target, "execution.max_stdout_bytes", 10)
 
 
-def test_resolve_path_handles_oserror(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+def test_resolve_path_is_absolute_for_relative_base_dir(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
     from mcp_shell_aliases.config import _resolve_path
-    # Monkeypatch Path.resolve to raise OSError
-    class Boom(Exception):
-        pass
 
-    def explode(self, strict=False):  # type: ignore[no-untyped-def]
-        raise OSError("boom")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "rel").mkdir()
+    (tmp_path / "rel" / "config.yaml").write_text("alias_files:\n  - aliases\n", encoding="utf-8")
 
-    monkeypatch.setattr(Path, "resolve", explode, raising=True)
-    # Should return candidate without raising
-    p = _resolve_path("relative/file.txt", base_dir=tmp_path)
-    assert str(p).endswith("relative/file.txt")
+    resolved = _resolve_path("relative/file.txt", base_dir=Path("rel"))
+    assert resolved == tmp_path / "rel" / "relative" / "file.txt"
+    config = Config.load(cwd=Path("rel"), env={})
+    assert config.alias_files == [tmp_path / "rel" / "aliases"]
 
 
 def test_parse_env_value_fallthrough_returns_raw() -> None:
     from mcp_shell_aliases.config import _parse_env_value
 
-    assert _parse_env_value("other.key", "rawval") == "rawval"
+    assert _parse_env_value(("other", "key"), "rawval") == "rawval"
+    assert _parse_env_value(("execution", "unmapped"), "5") == 5
+    assert _parse_env_value(("allow_cwd_roots",), "/a::/b") == ["/a", "/b"]
 
 
 def test_apply_override_creates_nested_dict() -> None:
@@ -154,7 +164,8 @@ def test_apply_override_creates_nested_dict() -> None:
 
     target: dict[str, object] = {}
     _apply_override(target, "a.b", 1)
-    assert target == {"a": {"b": 1}}
+    _apply_override(target, ("a", "c"), 2)
+    assert target == {"a": {"b": 1, "c": 2}}
 
 
 def test_deny_patterns_config_raises(tmp_path: Path) -> None:
@@ -218,3 +229,270 @@ def test_enable_hot_reload_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     monkeypatch.setenv("MCP_SHELL_ALIASES_ENABLE_HOT_RELOAD", "false")
     config = Config.load(cwd=tmp_path)
     assert config.enable_hot_reload is False
+
+
+def test_hot_reload_interval_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("MCP_SHELL_ALIASES_HOT_RELOAD_INTERVAL_SECONDS", "2.5")
+    assert Config.load(cwd=tmp_path).hot_reload_interval_seconds == 2.5
+
+    monkeypatch.setenv("MCP_SHELL_ALIASES_HOT_RELOAD_INTERVAL_SECONDS", "-1")
+    with pytest.raises(ConfigError):
+        Config.load(cwd=tmp_path)
+
+
+def test_config_file_parse_is_cached_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mcp_shell_aliases.config as config_mod
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("http_port: 4000\n", encoding="utf-8")
+
+    first = config_mod._read_config_file(config_path)
+    first["http_port"] = 1
+
+    calls: list[Path] = []
+    real_parse = config_mod._parse_config_file
+
+    def counting_parse(path: Path) -> dict[str, object]:
+        calls.append(path)
+        return real_parse(path)
+
+    monkeypatch.setattr(config_mod, "_parse_config_file", counting_parse)
+
+    # Unchanged file: served from the cache, unaffected by caller mutation.
+    assert config_mod._read_config_file(config_path) == {"http_port": 4000}
+    assert calls == []
+
+    config_path.write_text("http_port: 40001\n", encoding="utf-8")
+    assert config_mod._read_config_file(config_path) == {"http_port": 40001}
+    assert calls == [config_path]
+
+
+def test_config_module_does_not_import_yaml_eagerly() -> None:
+    import subprocess
+    import sys
+
+    code = "import sys, mcp_shell_aliases.config; print('yaml' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_cwd_policy_is_resolved_once(tmp_path: Path) -> None:
+    real = tmp_path / "real"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real)
+
+    config = Config(default_cwd=link, allow_cwd_roots=[link, tmp_path / "missing"])
+
+    assert config.resolved_default_cwd == real.resolve()
+    assert config.resolved_allow_cwd_roots == (real.resolve(), (tmp_path / "missing").resolve())
+
+
+def test_missing_default_config_is_negatively_cached(tmp_path: Path) -> None:
+    import os
+
+    from mcp_shell_aliases.config import _NEGATIVE_CONFIG_DIRS
+
+    old = 1_000_000_000_000_000_000
+    os.utime(tmp_path, ns=(old, old))
+    assert Config.load(cwd=tmp_path).http_port == 3921
+    assert _NEGATIVE_CONFIG_DIRS[tmp_path] == old
+
+    # Creating a config file bumps the directory mtime, invalidating the entry.
+    (tmp_path / "config.yaml").write_text("http_port: 4100\n", encoding="utf-8")
+    assert Config.load(cwd=tmp_path).http_port == 4100
+
+
+def test_cli_section_override_keeps_other_file_keys(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("execution:\n  max_stdout_bytes: 5000\n", encoding="utf-8")
+
+    config = Config.load(
+        config_path=config_path,
+        env={},
+        cli_overrides={"execution": {"default_timeout_seconds": 7}},
+    )
+
+    assert config.execution.max_stdout_bytes == 5000
+    assert config.execution.default_timeout_seconds == 7
+
+
+def test_empty_sections_fall_back_to_defaults(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("execution:\nallow_patterns:\n", encoding="utf-8")
+
+    config = Config.load(config_path=config_path, env={})
+
+    assert config.execution == ExecutionLimits()
+    assert config.allow_patterns == []
+
+
+def test_yaml_loader_prefers_libyaml() -> None:
+    import yaml
+
+    from mcp_shell_aliases.config import _yaml_safe_loader
+
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert _yaml_safe_loader() is expected
+
+
+def test_large_yaml_config_is_streamed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_shell_aliases import config as config_mod
+
+    monkeypatch.setattr(config_mod, "_YAML_STREAM_THRESHOLD", 16)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("# ünïcode comment\nallow_patterns:\n  - '^ls\\b'\n", encoding="utf-8")
+
+    assert config_mod._parse_config_file(config_path) == {"allow_patterns": [r"^ls\b"]}
+
+
+def test_config_parse_cache_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import mcp_shell_aliases.config as config_mod
+
+    monkeypatch.setattr(config_mod, "_PARSE_CACHE_MAX", 2)
+    monkeypatch.setattr(config_mod, "_PARSE_CACHE", config_mod.OrderedDict())
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"c{idx}.yaml"
+        path.write_text(f"http_port: {4000 + idx}\n", encoding="utf-8")
+        paths.append(path)
+
+    config_mod._read_config_file(paths[0])
+    config_mod._read_config_file(paths[1])
+    config_mod._read_config_file(paths[0])
+    config_mod._read_config_file(paths[2])
+
+    assert list(config_mod._PARSE_CACHE) == [paths[0], paths[2]]
+
+
+def test_config_sidecar_cache_skips_yaml_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mcp_shell_aliases.config as config_mod
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("http_port: 4100\nalias_files: [a, b]\n", encoding="utf-8")
+
+    assert config_mod._read_config_file(config_path, use_sidecar=True)["http_port"] == 4100
+    sidecar = tmp_path / "config.yaml.cache.json"
+    assert sidecar.exists()
+
+    config_mod._PARSE_CACHE.clear()
+
+    def fail_parse(path: Path) -> dict[str, object]:
+        raise AssertionError("YAML should not be parsed when the sidecar is current")
+
+    monkeypatch.setattr(config_mod, "_parse_config_file", fail_parse)
+    expected = {"http_port": 4100, "alias_files": ["a", "b"]}
+    assert config_mod._read_config_file(config_path, use_sidecar=True) == expected
+
+
+def test_config_sidecar_ignored_when_stale_or_disabled(tmp_path: Path) -> None:
+    import mcp_shell_aliases.config as config_mod
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("http_port: 4100\n", encoding="utf-8")
+    config_mod._read_config_file(config_path)
+    assert not (tmp_path / "config.yaml.cache.json").exists()
+
+    config_mod._PARSE_CACHE.clear()
+    config_mod._read_config_file(config_path, use_sidecar=True)
+    config_path.write_text("http_port: 41000\n", encoding="utf-8")
+    config_mod._PARSE_CACHE.clear()
+    assert config_mod._read_config_file(config_path, use_sidecar=True)["http_port"] == 41000
+
+
+def test_config_sidecar_opt_in_comes_from_load_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import mcp_shell_aliases.config as config_mod
+
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("http_port: 4100\n", encoding="utf-8")
+    sidecar = tmp_path / "config.yaml.cache.json"
+
+    monkeypatch.setenv(config_mod.CONFIG_CACHE_ENV, "1")
+    Config.load(config_path=config_path, env={})
+    assert not sidecar.exists()
+
+    monkeypatch.delenv(config_mod.CONFIG_CACHE_ENV)
+    config_mod._PARSE_CACHE.clear()
+    Config.load(config_path=config_path, env={config_mod.CONFIG_CACHE_ENV: "1"})
+    assert sidecar.exists()
+
+
+def test_merge_dict_nested_and_unchanged_values() -> None:
+    from mcp_shell_aliases.config import _merge_dict
+
+    keep = ["a"]
+    target: dict[str, object] = {"list": keep, "execution": {"x": 1, "y": 2}}
+    _merge_dict(target, {"list": ["a"], "execution": {"y": 3}, "new": None})
+
+    assert target == {"list": ["a"], "execution": {"x": 1, "y": 3}, "new": None}
+    assert target["list"] is keep
+
+    from types import MappingProxyType
+
+    _merge_dict(target, {"execution": MappingProxyType({"x": 5})})
+    assert target["execution"] == {"x": 5, "y": 3}
+
+
+def test_copy_tree_copies_containers() -> None:
+    import datetime
+
+    from mcp_shell_aliases.config import _copy_tree
+
+    source = {"a": [1, {"b": "c"}], "when": datetime.date(2024, 1, 2), "tags": {"x"}}
+    copied = _copy_tree(source)
+
+    assert copied == source
+    assert copied["a"] is not source["a"] and copied["a"][1] is not source["a"][1]
+    assert copied["tags"] is not source["tags"]
+
+
+def test_expand_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from mcp_shell_aliases.config import _expand_home
+
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert _expand_home("~") == tmp_path
+    assert _expand_home("~/work") == tmp_path / "work"
+    assert _expand_home("/srv/a~b") == Path("/srv/a~b")
+    assert _expand_home(Path("~/work")) == tmp_path / "work"
+
+
+def test_cli_overrides_accept_path_values(tmp_path: Path) -> None:
+    config = Config.load(
+        cwd=tmp_path,
+        env={},
+        cli_overrides={
+            "default_cwd": tmp_path,
+            "audit_log_path": tmp_path / "audit.log",
+            "allow_cwd_roots": [tmp_path],
+        },
+    )
+
+    assert config.default_cwd == tmp_path
+    assert config.audit_log_path == tmp_path / "audit.log"
+    assert config.allow_cwd_roots == [tmp_path]
+
+
+def test_cli_override_lists_are_copied(tmp_path: Path) -> None:
+    patterns = ["^git status$"]
+    config = Config.load(cwd=tmp_path, env={}, cli_overrides={"allow_patterns": patterns})
+
+    assert config.allow_patterns == patterns
+    assert config.allow_patterns is not patterns
+    patterns.append("^rm .*$")
+    assert config.allow_patterns == ["^git status$"]
+
+
+def test_resolve_path_normalizes_without_following_symlinks(tmp_path: Path) -> None:
+    from mcp_shell_aliases.config import _resolve_path
+
+    (tmp_path / "real").mkdir()
+    (tmp_path / "link").symlink_to(tmp_path / "real")
+
+    assert _resolve_path("link/./x/../aliases", base_dir=tmp_path) == tmp_path / "link" / "aliases"
+    assert _resolve_path("/etc//aliases", base_dir=tmp_path) == Path("/etc/aliases")
@@ -1,5 +1,7 @@
 # Copyright (C) 2025 Heston Hamilton
 from __future__ import annotations
+import dataclasses
+import os
 from pathlib import Path
 
 import pytest
@@ -8,7 +10,8 @@ from mcp_shell_aliases.aliases import Alias
 from mcp_shell_aliases.config import Config, ExecutionLimits
 from mcp_shell_aliases.errors import CwdNotAllowedError
 from mcp_shell_aliases.execution import ExecutionResult, execute_alias, write_audit_log
-from mcp_shell_aliases.execution import _build_command, _resolve_cwd, _is_within, _build_env, _redact
+from mcp_shell_aliases.execution import _build_command, _resolve_cwd, _build_env, _redact
+from mcp_shell_aliases.execution import _direct_argv
 
 
 def make_config(tmp_path: Path) -> Config:
@@ -163,13 +166,40 @@ def test_build_command_string_arg_whitespace() -> None:
 
 def test_build_command_iterable_empty() -> None:
     assert _build_command("echo hi", []) == "echo hi"
+    assert _build_command("echo hi", ["", ""]) == "echo hi"
 
 
-def test_is_within_true_and_false(tmp_path: Path) -> None:
-    inner = tmp_path / "inner"
+def test_build_command_iterable_skips_empty_args() -> None:
+    assert _build_command("echo hi", ["a", "", "b"]) == "echo hi a b"
+
+
+def test_cwd_policy_follows_reassigned_fields(tmp_path: Path) -> None:
+    inner = (tmp_path / "inner").resolve()
+    other = (tmp_path / "other").resolve()
     inner.mkdir()
-    assert _is_within(inner, tmp_path) is True
-    assert _is_within(tmp_path, inner) is False
+    other.mkdir()
+    cfg = make_config(inner)
+    with pytest.raises(CwdNotAllowedError):
+        _resolve_cwd(other, cfg)
+
+    cfg.allow_cwd_roots.append(other)
+    assert _resolve_cwd(other, cfg) == other
+
+    cfg.allow_cwd_roots = [inner]
+    with pytest.raises(CwdNotAllowedError):
+        _resolve_cwd(other, cfg)
+
+    cfg.default_cwd = other
+    assert _resolve_cwd(None, cfg) == other
+
+
+def test_resolve_cwd_rejects_parent_of_root(tmp_path: Path) -> None:
+    inner = (tmp_path / "inner").resolve()
+    inner.mkdir()
+    cfg = make_config(inner)
+
+    with pytest.raises(CwdNotAllowedError):
+        _resolve_cwd(tmp_path, cfg)
 
 
 def test_resolve_cwd_allows_within_root(tmp_path: Path) -> None:
@@ -180,6 +210,21 @@ def test_resolve_cwd_allows_within_root(tmp_path: Path) -> None:
     assert path == inner
 
 
+def test_resolve_cwd_root_itself_and_sibling_prefix(tmp_path: Path) -> None:
+    root = (tmp_path / "work").resolve()
+    sibling = (tmp_path / "workshop").resolve()
+    root.mkdir()
+    sibling.mkdir()
+    cfg = make_config(root)
+
+    assert _resolve_cwd(root, cfg) == root
+    with pytest.raises(CwdNotAllowedError):
+        _resolve_cwd(sibling, cfg)
+
+    cfg = dataclasses.replace(cfg, allow_cwd_roots=[Path("/")])
+    assert _resolve_cwd(sibling, cfg) == sibling
+
+
 def test_build_env_passes_through_locale(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     base = {"LANG": "C.UTF-8", "LC_ALL": "C.UTF-8", "LC_CTYPE": "en_US.UTF-8"}
     cfg = make_config(tmp_path)
@@ -193,6 +238,24 @@ def test_redact_list_items() -> None:
     assert out["items"][0] == "<redacted>"
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("curl -H 'Authorization: Bearer abc123' host", "curl -H '<redacted> host"),
+        ("API_KEY=xyz run", "<redacted> run"),
+        ("--api-key=abc --verbose", "--<redacted> --verbose"),
+        ("ls -la", "ls -la"),
+    ],
+)
+def test_redact_extended_keywords(value: str, expected: str) -> None:
+    assert _redact({"args": value})["args"] == expected
+
+
+def test_redact_nested_containers() -> None:
+    out = _redact({"env": {"vars": ["password=x", 1]}, "n": 2})
+    assert out == {"env": {"vars": ["<redacted>", 1]}, "n": 2}
+
+
 @pytest.mark.asyncio
 async def test_audit_log_serializes_iterable_args(tmp_path: Path) -> None:
     alias = Alias(name="greet", expansion="echo hello", safe=True, source_file=tmp_path / "aliases")
@@ -308,3 +371,202 @@ async def test_env_and_cwd_are_set(tmp_path: Path) -> None:
     expected_home = str(config.default_cwd)
     expected_pwd = str(config.default_cwd)
     assert result.stdout.strip() == f"{expected_home}::{expected_pwd}"
+
+
+@pytest.mark.asyncio
+async def test_read_capped_keeps_one_byte_past_limit() -> None:
+    import asyncio
+
+    from mcp_shell_aliases.execution import _read_capped
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"a" * 100_000)
+    reader.feed_data(b"b" * 100_000)
+    reader.feed_eof()
+
+    data = await _read_capped(reader, 10)
+    assert data == b"a" * 11
+    assert await _read_capped(None, 10) == b""
+
+
+@pytest.mark.asyncio
+async def test_execute_uses_env_template(tmp_path: Path) -> None:
+    from mcp_shell_aliases.execution import build_env_template
+
+    inner = tmp_path / "inner"
+    inner.mkdir()
+    alias = Alias(
+        name="pwd", expansion="echo $PWD::$LANG", safe=True, source_file=tmp_path / "aliases"
+    )
+    config = make_config(tmp_path)
+    template = build_env_template(config, {"LANG": "en_GB.UTF-8"})
+
+    result = await execute_alias(
+        alias,
+        args=None,
+        config=config,
+        dry_run=False,
+        requested_cwd=inner,
+        timeout_override=None,
+        env_template=template,
+    )
+
+    assert result.stdout.strip() == f"{inner.resolve()}::en_GB.UTF-8"
+    assert template["PWD"] == str(config.resolved_default_cwd)
+
+
+@pytest.mark.asyncio
+async def test_audit_log_handle_is_reused(tmp_path: Path) -> None:
+    from mcp_shell_aliases.execution import _AUDIT_HANDLES, close_audit_logs
+
+    alias = Alias(name="greet", expansion="echo hello", safe=True, source_file=tmp_path / "aliases")
+    config = make_config(tmp_path)
+    config.audit_log_path = tmp_path / "nested" / "audit.log"
+    result = await execute_alias(
+        alias, args=None, config=config, dry_run=True, requested_cwd=None, timeout_override=None
+    )
+
+    write_audit_log(config=config, alias=alias, args=None, cwd=result.cwd, result=result)
+    handle = _AUDIT_HANDLES[config.audit_log_path]
+    write_audit_log(config=config, alias=alias, args=None, cwd=result.cwd, result=result)
+
+    assert _AUDIT_HANDLES[config.audit_log_path] is handle
+    assert len(config.audit_log_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    close_audit_logs()
+    assert handle.closed
+    assert not _AUDIT_HANDLES
+
+
+def test_redact_skips_strings_without_secret_keywords() -> None:
+    out = _redact({"cwd": "/home/me", "args": "--Api-TOKEN=abc --flag", "exitCode": 0})
+    assert out == {"cwd": "/home/me", "args": "--Api-<redacted> --flag", "exitCode": 0}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_serialization_backends_agree(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    from mcp_shell_aliases import serialization
+
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "_orjson", None)
+    elif serialization._orjson is None:
+        pytest.skip("orjson not installed")
+
+    value = {"alias": "hi", "args": "wörld", "exitCode": 0, "timedOut": False}
+    args = "wörld" if use_orjson else "w\\u00f6rld"
+    assert serialization.dumps_compact(value) == (
+        f'{{"alias":"hi","args":"{args}","exitCode":0,"timedOut":false}}'.encode("utf-8")
+    )
+    assert serialization.loads(serialization.dumps_compact(value)) == value
+    assert serialization.dumps_pretty({"a": [1]}) == '{\n  "a": [\n    1\n  ]\n}'
+    assert serialization.loads(b'{"a":1}') == {"a": 1}
+
+    undecodable = {"cwd": "/srv/caf\udce9"}
+    assert serialization.dumps_compact(undecodable) == b'{"cwd":"/srv/caf\\udce9"}'
+    assert serialization.loads(serialization.dumps_pretty(undecodable)) == undecodable
+
+
+@pytest.mark.asyncio
+async def test_audit_log_written_for_undecodable_cwd(tmp_path: Path) -> None:
+    import json
+
+    alias = Alias(name="greet", expansion="echo hello", safe=True, source_file=tmp_path / "aliases")
+    config = make_config(tmp_path)
+    result = await execute_alias(
+        alias, args=None, config=config, dry_run=True, requested_cwd=None, timeout_override=None
+    )
+    cwd = Path(os.fsdecode(b"/srv/caf\xe9"))
+
+    write_audit_log(config=config, alias=alias, args=None, cwd=cwd, result=result)
+
+    entry = json.loads(config.audit_log_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert entry["cwd"] == str(cwd)
+
+
+@pytest.mark.parametrize(
+    "command, argv",
+    [
+        ("/usr/bin/git status -s", ["/usr/bin/git", "status", "-s"]),
+        ("./build --format=%h", ["./build", "--format=%h"]),
+        ("git status -s", None),
+        ("echo hi", None),
+        ("A=/bin/x ls", None),
+        ("ls | wc -l", None),
+        ("FOO=1 ls", None),
+        ("ls ~ $HOME *.py", None),
+        ("grep 'a b' file", None),
+        ("ls\nrm -rf x", None),
+    ],
+)
+def test_direct_argv_only_for_plain_words_with_a_path(command: str, argv: list[str] | None) -> None:
+    assert _direct_argv(command) == argv
+
+
+@pytest.mark.asyncio
+async def test_execute_direct_and_bash_fallback(tmp_path: Path) -> None:
+    (tmp_path / "note.txt").write_text("direct\n", encoding="utf-8")
+    config = make_config(tmp_path)
+
+    source = tmp_path / "aliases"
+    direct = Alias(name="show", expansion="/bin/cat note.txt", safe=True, source_file=source)
+    result = await execute_alias(
+        direct, args=None, config=config, dry_run=False, requested_cwd=None, timeout_override=None
+    )
+    assert result.exit_code == 0
+    assert result.stdout == "direct\n"
+
+    missing = Alias(
+        name="nope", expansion="definitely-not-a-command-xyz", safe=True, source_file=source
+    )
+    result = await execute_alias(
+        missing, args=None, config=config, dry_run=False, requested_cwd=None, timeout_override=None
+    )
+    assert result.exit_code == 127
+    assert "not found" in result.stderr
+
+
+@pytest.mark.asyncio
+async def test_execute_script_without_shebang_falls_back_to_bash(tmp_path: Path) -> None:
+    script = tmp_path / "hello"
+    script.write_text("echo hi from script\n", encoding="utf-8")
+    script.chmod(0o755)
+    config = make_config(tmp_path)
+
+    alias = Alias(name="hello", expansion="./hello", safe=True, source_file=tmp_path / "aliases")
+    result = await execute_alias(
+        alias, args=None, config=config, dry_run=False, requested_cwd=None, timeout_override=None
+    )
+    assert result.exit_code == 0
+    assert result.stdout == "hi from script\n"
+
+
+def test_utc_timestamp_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_shell_aliases import execution
+
+    monkeypatch.setattr(execution.time, "time_ns", lambda: 1_700_000_000_042_000_000)
+    assert execution._utc_timestamp() == "2023-11-14T22:13:20.042Z"
+    monkeypatch.setattr(execution.time, "time_ns", lambda: 1_700_000_001_999_999_999)
+    assert execution._utc_timestamp() == "2023-11-14T22:13:21.999Z"
+
+
+@pytest.mark.asyncio
+async def test_audit_log_threads_share_one_handle(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from mcp_shell_aliases.execution import _AUDIT_HANDLES, close_audit_logs
+
+    alias = Alias(name="greet", expansion="echo hello", safe=True, source_file=tmp_path / "aliases")
+    config = make_config(tmp_path)
+    result = await execute_alias(
+        alias, args=None, config=config, dry_run=True, requested_cwd=None, timeout_override=None
+    )
+
+    def write(_: int) -> None:
+        write_audit_log(config=config, alias=alias, args=None, cwd=result.cwd, result=result)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(64)))
+
+    assert config.audit_log_path in _AUDIT_HANDLES
+    assert len(config.audit_log_path.read_text(encoding="utf-8").splitlines()) == 64
+    close_audit_logs()
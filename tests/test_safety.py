@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+import sys
+
 import pytest
 
 from mcp_shell_aliases.safety import SafetyClassifier, _normalize_regex
@@ -37,3 +40,96 @@ def test_normalize_regex_handles_invalid_sequence() -> None:
 def test_is_safe_uses_allowlist_only(expansion: str, expected: bool) -> None:
     classifier = SafetyClassifier.from_strings([r"^ls"])
     assert classifier.is_safe(expansion) is expected
+
+
+def test_allow_patterns_are_fused_into_one_regex() -> None:
+    classifier = SafetyClassifier.from_strings(
+        [r"^ls\b", r"^git\b(?!\s+(push|reset))", r"^cat\b", r"^make( |$)", r"^just$"]
+    )
+    assert classifier.combined is not None
+    assert classifier.is_safe("make test") is True
+    assert classifier.is_safe("just") is True
+    assert classifier.is_safe("git status") is True
+    assert classifier.is_safe("git push origin") is False
+    assert classifier.is_safe("cat README.md") is True
+    assert classifier.is_safe("rm -rf /") is False
+
+
+@pytest.mark.parametrize("patterns", [[r"^(a)\1", r"^ls"], [r"(?i)^ls", r"^cat"]])
+def test_unfusable_patterns_fall_back_to_individual_search(patterns: list[str]) -> None:
+    classifier = SafetyClassifier.from_strings(patterns)
+    assert classifier.combined is None
+    assert classifier.is_safe("aa") is (patterns[0] == r"^(a)\1")
+    assert classifier.is_safe("LS -l") is (patterns[0] == r"(?i)^ls")
+
+
+def test_inline_global_flags_are_not_fused() -> None:
+    from mcp_shell_aliases.safety import _combine_patterns
+
+    patterns = [re.compile(r"^cat"), re.compile(r"(?i)^ls")]
+    assert _combine_patterns(patterns) is None
+
+    classifier = SafetyClassifier.from_strings([r"^cat", r"(?i)^ls"])
+    assert classifier.is_safe("CAT /etc/shadow") is False
+    assert classifier.is_safe("LS -l") is True
+
+
+def test_group_conditionals_are_not_fused() -> None:
+    patterns = [r"^(a)?zz", r"^(x)?(?(1)SAFE|rm)"]
+    classifier = SafetyClassifier.from_strings(patterns)
+    assert classifier.combined is None
+
+    reference = [re.compile(p) for p in patterns]
+    for expansion in ["xrm -rf /", "rm -rf /", "xSAFE", "zz"]:
+        expected = any(p.search(expansion) for p in reference)
+        assert classifier.is_safe(expansion) is expected, expansion
+
+
+def test_literal_head_patterns_use_set_lookup() -> None:
+    patterns = [r"^ls\b", r"^cat\b", r"^git\b(?!\s+push)"]
+    classifier = SafetyClassifier.from_strings(patterns)
+    assert classifier.literal_heads == frozenset({"ls", "cat"})
+    assert classifier.patterns_by_head == {"git": [re.compile(r"^git\b(?!\s+push)")]}
+    assert classifier.residual_patterns == []
+
+    samples = ["ls", "ls -l", "ls-tree", "lsof", "cat.exe", " ls", "git log", "git push", "x ls"]
+    reference = [re.compile(p) for p in patterns]
+    for expansion in samples:
+        expected = any(p.search(expansion) for p in reference)
+        assert classifier.is_safe(expansion) is expected, expansion
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 11), reason="3.11+ rejects misplaced global flags")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_head_prefixed_patterns_with_global_flags_stay_generic() -> None:
+    # Python 3.10 applies a misplaced (?i) to the whole pattern, so "GIT" matches too.
+    classifier = SafetyClassifier.from_strings([r"^git\b(?i)(?!\s+push)"])
+    assert classifier.patterns_by_head == {}
+    assert classifier.is_safe("GIT status") is True
+
+
+def test_head_prefixed_patterns_with_alternation_stay_generic() -> None:
+    patterns = [r"^git\b(?!\s+push)|status", r"^rg\b[|]x", r"^gh\b(a|b)", r"^ls\w*\b"]
+    classifier = SafetyClassifier.from_strings(patterns)
+    assert sorted(classifier.patterns_by_head) == ["gh", "rg"]
+    assert [p.pattern for p in classifier.residual_patterns] == [patterns[0], patterns[3]]
+
+    samples = ["git push", "x status", "rg|x", "gh a", "gh c", "lsof", "ls x"]
+    reference = [re.compile(p) for p in patterns]
+    for expansion in samples:
+        expected = any(p.search(expansion) for p in reference)
+        assert classifier.is_safe(expansion) is expected, expansion
+
+
+def test_is_safe_caches_verdicts_per_expansion(monkeypatch: pytest.MonkeyPatch) -> None:
+    from mcp_shell_aliases import safety
+
+    monkeypatch.setattr(safety, "_MAX_CACHED_VERDICTS", 2)
+    classifier = SafetyClassifier.from_strings([r"^ls\b"])
+
+    assert classifier.is_safe("ls -l") is True
+    assert classifier.is_safe("rm -rf /") is False
+    assert classifier.verdicts == {"ls -l": True, "rm -rf /": False}
+
+    classifier.is_safe("ls -a")
+    assert classifier.verdicts == {"ls -a": True}
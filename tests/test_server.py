@@ -144,6 +144,52 @@ def test_runtime_refresh_disabled(tmp_path: Path) -> None:
     assert aliases[0].name == "safe"
 
 
+def test_runtime_refresh_reloads_only_on_change(alias_file: Path, tmp_path: Path) -> None:
+    runtime = AliasRuntime.build(make_config(tmp_path, alias_file))
+    catalog = runtime.catalog
+
+    runtime.list_aliases()
+    assert runtime.catalog is catalog
+
+    alias_file.write_text("alias safe='echo changed'\n", encoding="utf-8")
+    aliases = runtime.list_aliases()
+    assert runtime.catalog is not catalog
+    assert [alias.expansion for alias in aliases] == ["echo changed"]
+
+
+def test_runtime_refresh_honours_check_interval(
+    alias_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = make_config(tmp_path, alias_file)
+    config.hot_reload_interval_seconds = 10
+    runtime = AliasRuntime.build(config)
+    clock = [100.0]
+    monkeypatch.setattr("mcp_shell_aliases.server.time.monotonic", lambda: clock[0])
+
+    runtime.refresh()
+    catalog = runtime.catalog
+    alias_file.write_text("alias safe='echo changed'\n", encoding="utf-8")
+    clock[0] = 105.0
+    runtime.refresh()
+    assert runtime.catalog is catalog
+
+    clock[0] = 110.0
+    runtime.refresh()
+    assert runtime.catalog is not catalog
+
+
+def test_runtime_catalog_views_are_cached_per_catalog(alias_file: Path, tmp_path: Path) -> None:
+    runtime = AliasRuntime.build(make_config(tmp_path, alias_file))
+
+    body = runtime.catalog_json()
+    assert runtime.catalog_json() is body
+    assert runtime.catalog_dicts() is runtime.catalog_dicts()
+    assert sorted(entry["name"] for entry in json.loads(body)) == ["danger", "safe"]
+
+    alias_file.write_text("alias safe='echo changed'\n", encoding="utf-8")
+    assert [entry["expansion"] for entry in json.loads(runtime.catalog_json())] == ["echo changed"]
+
+
 def test_run_prefers_stdio(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     class DummyServer:
         def __init__(self) -> None: